@@ -1,6 +1,13 @@
+import numpy as np
 import pygame
 import random
 
+try:
+    # Необязательное C-расширение (сборка: cythonize -i _tetris_core.pyx)
+    import _tetris_core
+except ImportError:
+    _tetris_core = None
+
 pygame.init()
 
 # Основные игровые константы
@@ -9,7 +16,19 @@ SCREEN_HEIGHT = 600      # Высота игрового окна в пиксе
 BLOCK_SIZE = 30          # Размер одного блока/клетки в пикселях
 GRID_WIDTH = 10          # Ширина игровой сетки в блоках (колонки)
 GRID_HEIGHT = 20         # Высота игровой сетки в блоках (строки)
+GRID_OFFSET_X = (SCREEN_WIDTH - GRID_WIDTH * BLOCK_SIZE) // 2  # Отступ сетки от левого края окна
 FPS = 60                 # Частота обновления кадров в секунду
+GRID_PADDING = 3         # Толщина рамки-стража вокруг поля в битовом представлении (размер фигуры - 1)
+
+# Битовое представление поля: строка y занимает ROW_BITS бит, начиная с бита y * ROW_BITS.
+# Клетка (x, y) хранится в бите y * ROW_BITS + GRID_PADDING + x, по бокам строки и в
+# GRID_PADDING строках под полем лежат всегда установленные биты-стражи.
+ROW_BITS = GRID_WIDTH + 2 * GRID_PADDING
+FULL_ROW = (1 << ROW_BITS) - 1
+EMPTY_ROW = FULL_ROW ^ (((1 << GRID_WIDTH) - 1) << GRID_PADDING)
+ROW_STARTS = sum(1 << (y * ROW_BITS) for y in range(GRID_HEIGHT))
+COLUMN_BITS = sum(1 << (y * ROW_BITS) for y in range(GRID_HEIGHT + GRID_PADDING))
+EMPTY_BOARD = EMPTY_ROW * ROW_STARTS | ((1 << (GRID_PADDING * ROW_BITS)) - 1) << (GRID_HEIGHT * ROW_BITS)
 
 COLORS = [
     (0, 0, 0),  # Черный (фон)
@@ -35,12 +54,77 @@ SHAPES = [
 ]
 
 
+def build_rotations(shape):
+    """
+    Строит список всех различных поворотов формы по часовой стрелке.
+
+    Повороты вычисляются последовательно через np.rot90 и хранятся как булевы маски.
+    Построение останавливается, как только очередной поворот совпадает с исходной
+    формой, поэтому у O-фигуры один поворот, у I, S и Z - два, у остальных - четыре.
+    """
+
+    rotations = [np.array(shape, dtype=bool)]
+    while True:
+        rotated = np.ascontiguousarray(np.rot90(rotations[-1], -1))
+        if np.array_equal(rotated, rotations[0]):
+            return rotations
+        rotations.append(rotated)
+
+
+def shape_offsets(mask):
+    """
+    Возвращает координаты (y, x) заполненных ячеек маски формы в порядке обхода по строкам.
+    """
+
+    return tuple(tuple(cell) for cell in np.argwhere(mask).tolist())
+
+
+def shape_bits(offsets):
+    """
+    Упаковывает ячейки формы в целое число в формате битового поля (шаг строки ROW_BITS).
+    """
+
+    return sum(1 << (y * ROW_BITS + x) for y, x in offsets)
+
+
+def column_bottoms(offsets):
+    """
+    Возвращает пары (x, y) с нижней заполненной ячейкой формы в каждом ее столбце.
+    """
+
+    bottoms = {}
+    for y, x in offsets:
+        bottoms[x] = max(y, bottoms.get(x, y))
+    return tuple(sorted(bottoms.items()))
+
+
+# Заранее вычисленные повороты для каждой формы из SHAPES, координаты их
+# заполненных ячеек, нижние ячейки столбцов и битовые маски
+SHAPE_ROTATIONS = [build_rotations(shape) for shape in SHAPES]
+NONZERO_OFFSETS = [[shape_offsets(mask) for mask in rotations] for rotations in SHAPE_ROTATIONS]
+COLUMN_BOTTOMS = [[column_bottoms(offsets) for offsets in rotations] for rotations in NONZERO_OFFSETS]
+SHAPE_BITS = [[shape_bits(offsets) for offsets in rotations] for rotations in NONZERO_OFFSETS]
+
+# Параметры генерации случайной фигуры (цвет 0 - фон, поэтому не используется)
+_NUM_SHAPES = len(SHAPE_ROTATIONS)
+_NUM_COLORS = len(COLORS) - 1
+_rand = random.randrange
+
+
 class Tetromino:
     """
     Класс для представления тетромино (фигуры в тетрисе).
 
     Attributes:
-        shape (list): 2D-матрица, определяющая форму тетромино.
+        rotations (list[np.ndarray]): Заранее вычисленные повороты формы (булевы 2D-маски).
+        rotation_offsets (list[tuple]): Координаты (y, x) заполненных ячеек каждого поворота.
+        rotation_bottoms (list[tuple]): Нижние ячейки (x, y) каждого столбца для каждого поворота.
+        rotation_bits (list[int]): Битовые маски поворотов в формате битового поля.
+        rot_index (int): Индекс текущего поворота в списке rotations.
+        shape (np.ndarray): Булева 2D-маска текущего поворота, определяющая форму тетромино.
+        offsets (tuple): Координаты (y, x) заполненных ячеек текущего поворота.
+        column_bottoms (tuple): Нижние ячейки (x, y) каждого столбца текущего поворота.
+        bits (int): Битовая маска текущего поворота.
         color (int): Индекс цвета из глобального списка COLORS.
         x (int): Горизонтальная позиция в сетке.
         y (int): Вертикальная позиция в сетке.
@@ -54,13 +138,34 @@ class Tetromino:
         Инициализирует новый тетромино со случайными параметрами.
         """
 
-        self.shape = random.choice(SHAPES)
-        self.color = random.randint(1, len(COLORS) - 1)
+        shape_index = _rand(_NUM_SHAPES)
+        self.rotations = SHAPE_ROTATIONS[shape_index]
+        self.rotation_offsets = NONZERO_OFFSETS[shape_index]
+        self.rotation_bottoms = COLUMN_BOTTOMS[shape_index]
+        self.rotation_bits = SHAPE_BITS[shape_index]
+        self.rot_index = 0
+        self.color = 1 + _rand(_NUM_COLORS)
         self.x = x
         self.y = y
 
+    @property
+    def shape(self):
+        return self.rotations[self.rot_index]
+
+    @property
+    def offsets(self):
+        return self.rotation_offsets[self.rot_index]
+
+    @property
+    def column_bottoms(self):
+        return self.rotation_bottoms[self.rot_index]
+
+    @property
+    def bits(self):
+        return self.rotation_bits[self.rot_index]
+
     def rotate(self):
-        self.shape = [list(row)[::-1] for row in zip(*self.shape)]
+        self.rot_index = (self.rot_index + 1) % len(self.rotations)
 
 
 class Game:
@@ -72,17 +177,42 @@ class Game:
         screen (pygame.Surface): Основное окно отрисовки Pygame
         clock (pygame.time.Clock): Таймер для контроля FPS
         font (pygame.font.Font): Шрифт для отображения текста
-        grid (list[list[int]]): Матрица 20x10, представляющая игровое поле:
+        grid (np.ndarray): Матрица 20x10 (uint8) с индексами цветов, представляющая игровое поле
+        occ (int): Битовое поле занятости клеток (см. ROW_BITS), используется для проверки
+            столкновений и сдвига строк при их очистке
+        row_counts (list[int]): Количество занятых клеток в каждой строке сетки
+        core (_tetris_core.Field | None): Обертка C-расширения над grid или None, если оно не собрано
+        block_surfs (list[pygame.Surface]): Залитые поверхности блоков для каждого цвета из COLORS
+        cell_rects (list[list[pygame.Rect]]): Экранные области блоков каждой клетки сетки
+        grid_overlay (pygame.Surface): Прозрачная поверхность с заранее нарисованными линиями сетки
         score (int): Накопленные очки (увеличивается за собранные линии)
         level (int): Текущий уровень сложности (1-10)
         fall_speed (int): Интервал падения фигур в миллисекундах
         last_fall (int): Время последнего автоматического смещения фигуры вниз
+        prev_piece_cells (list[tuple]): Клетки (y, x), занятые фигурой в прошлом кадре
+        dirty_cells (set[tuple]): Клетки (y, x) сетки, изменившиеся с прошлого кадра
+        hud_rects (list[pygame.Rect]): Области экрана, занятые текстом интерфейса
+        hud_cells (set[tuple]): Клетки (y, x) сетки, пересекающиеся с текстом интерфейса
+        full_redraw (bool): Признак того, что в следующем кадре нужно перерисовать весь экран
+        dirty (bool): Признак изменения состояния игры (фигуры или сетки) с прошлой отрисовки
+        _score_cache (tuple): Последний отрисованный счет и его готовая текстовая поверхность
+        _level_cache (tuple): Последний отрисованный уровень и его готовая текстовая поверхность
+        _key_handlers (dict): Обработчики нажатий клавиш, ключ - код клавиши pygame
 
     Methods:
         new_piece(): Создает новую фигуру и проверяет Game Over
         draw_grid(): Отрисовывает сетку и зафиксированные блоки
         draw_piece(): Отрисовывает текущую падающую фигуру
+        draw_hud(): Отрисовывает текст интерфейса (счет и уровень)
+        draw_frame(): Перерисовывает изменившиеся части кадра и обновляет окно
+        piece_cells(): Возвращает клетки сетки, занимаемые фигурой
+        cells_in_rect(): Возвращает клетки сетки, пересекающиеся с областью экрана
         check_collision(): Проверяет столкновения с границами и другими блоками
+        drop_distance(): Вычисляет, на сколько строк фигура может упасть без столкновения
+        move_left(), move_right(): Сдвигают фигуру на клетку влево/вправо
+        soft_drop(): Опускает фигуру на одну клетку вниз
+        rotate_piece(): Поворачивает фигуру, если после поворота нет столкновения
+        hard_drop(): Мгновенно опускает фигуру до упора и фиксирует ее
         merge_piece(): Фиксирует фигуру в игровом поле
         clear_lines(): Удаляет заполненные линии и обновляет счет
         game_over(): Обрабатывает завершение игры
@@ -96,13 +226,72 @@ class Game:
 
         self.current_piece = None
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Tetris")
+        # В очередь событий попадают только нужные игре типы, остальные SDL отбрасывает сам
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("Arial", 20)
-        self.grid = [[0] * GRID_WIDTH for _ in range(GRID_HEIGHT)]
+        self.grid = np.zeros((GRID_HEIGHT, GRID_WIDTH), dtype=np.uint8)
+        self.occ = EMPTY_BOARD
+        self.row_counts = [0] * GRID_HEIGHT
+        self.core = _tetris_core.Field(self.grid, ROW_BITS) if _tetris_core is not None else None
+
+        # Заранее залитые поверхности блоков каждого цвета и экранные координаты клеток,
+        # чтобы отрисовка сетки сводилась к одному вызову Surface.blits за кадр.
+        # Поверхности приводятся к формату пикселей экрана, чтобы blit был простым копированием
+        self.block_surfs = []
+        for color in COLORS:
+            surf = pygame.Surface((BLOCK_SIZE - 1, BLOCK_SIZE - 1)).convert()
+            surf.fill(color)
+            self.block_surfs.append(surf)
+        self.cell_rects = [
+            [
+                pygame.Rect(GRID_OFFSET_X + x * BLOCK_SIZE, y * BLOCK_SIZE, BLOCK_SIZE - 1, BLOCK_SIZE - 1)
+                for x in range(GRID_WIDTH)
+            ]
+            for y in range(GRID_HEIGHT)
+        ]
+
+        # Линии сетки не меняются, поэтому рисуются один раз в прозрачную поверхность
+        self.grid_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        for x in range(GRID_WIDTH + 1):
+            pygame.draw.line(
+                self.grid_overlay,
+                (40, 40, 40),  # Серый цвет
+                (GRID_OFFSET_X + x * BLOCK_SIZE, 0),
+                (GRID_OFFSET_X + x * BLOCK_SIZE, GRID_HEIGHT * BLOCK_SIZE),
+                1
+            )
+
+        for y in range(GRID_HEIGHT + 1):
+            pygame.draw.line(
+                self.grid_overlay,
+                (40, 40, 40),
+                (GRID_OFFSET_X, y * BLOCK_SIZE),
+                (GRID_OFFSET_X + GRID_WIDTH * BLOCK_SIZE, y * BLOCK_SIZE),
+                1
+            )
+        self.grid_overlay = self.grid_overlay.convert_alpha()
         self.score = 0
         self.level = 1
         self.fall_speed = 1000
         self.last_fall = pygame.time.get_ticks()
+        self.prev_piece_cells = []
+        self.dirty_cells = set()
+        self.hud_rects = []
+        self.hud_cells = set()
+        self.full_redraw = True
+        self.dirty = True
+        self._score_cache = (None, None)
+        self._level_cache = (None, None)
+        self._key_handlers = {
+            pygame.K_LEFT: self.move_left,
+            pygame.K_RIGHT: self.move_right,
+            pygame.K_DOWN: self.soft_drop,
+            pygame.K_UP: self.rotate_piece,
+            pygame.K_SPACE: self.hard_drop
+        }
         self.new_piece()
 
     def new_piece(self):
@@ -119,88 +308,242 @@ class Game:
 
         Метод выполняет две основные задачи:
         1. Рисует цветные блоки в соответствии с данными из матрицы self.grid:
-            - Каждая ячейка сетки представлена квадратом размера BLOCK_SIZE.
-            - Цвет блока определяется значением в матрице grid через глобальный список COLORS.
+            - Каждой ячейке сопоставляется заранее залитая поверхность блока (self.block_surfs)
+              по индексу цвета из матрицы grid и её позиция из self.cell_rects.
+            - Все блоки выводятся одним вызовом self.screen.blits().
+            - Строки сетки и их координаты перебираются парно через zip, без индексации.
         2. Рисует серую сетку поверх блоков для визуального разделения:
+            - Линии заранее нарисованы в прозрачную поверхность self.grid_overlay,
+              которая выводится одним blit.
         """
 
-        for y in range(GRID_HEIGHT):
-            for x in range(GRID_WIDTH):
-                rect = pygame.Rect(
-                    x * BLOCK_SIZE + (SCREEN_WIDTH - GRID_WIDTH * BLOCK_SIZE) // 2,
-                    y * BLOCK_SIZE,
-                    BLOCK_SIZE - 1,
-                    BLOCK_SIZE - 1
-                )
-                pygame.draw.rect(self.screen, COLORS[self.grid[y][x]], rect)
-
-        start_x = (SCREEN_WIDTH - GRID_WIDTH * BLOCK_SIZE) // 2
-
-        for x in range(GRID_WIDTH + 1):
-            pygame.draw.line(
-                self.screen,
-                (40, 40, 40),  # Серый цвет
-                (start_x + x * BLOCK_SIZE, 0),
-                (start_x + x * BLOCK_SIZE, GRID_HEIGHT * BLOCK_SIZE),
-                1
-            )
-
-        for y in range(GRID_HEIGHT + 1):
-            pygame.draw.line(
-                self.screen,
-                (40, 40, 40),
-                (start_x, y * BLOCK_SIZE),
-                (start_x + GRID_WIDTH * BLOCK_SIZE, y * BLOCK_SIZE),
-                1
-            )
+        block_surfs = self.block_surfs
+        blits = [
+            (block_surfs[color], pos)
+            for row, positions in zip(self.grid.tolist(), self.cell_rects)
+            for color, pos in zip(row, positions)
+        ]
+        self.screen.blits(blits, doreturn=0)
+        self.screen.blit(self.grid_overlay, (0, 0))
 
     def draw_piece(self, piece):
         """
         Отрисовывает текущую падающую фигуру на игровом поле.
 
         Действия метода:
-            - Перебирает матрицу формы фигуры (piece.shape).
-            - Для каждой заполненной ячейки (значение 1) вычисляет экранные координаты:
+            - Перебирает только заполненные ячейки фигуры (piece.offsets).
+            - Для каждой ячейки вычисляет экранные координаты.
             - Рисует квадрат с цветом фигуры (COLORS[piece.color]) и небольшим
               отступом (BLOCK_SIZE - 1) для визуального разделения блоков.
         """
 
-        for y, row in enumerate(piece.shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    rect = pygame.Rect(
-                        (piece.x + x) * BLOCK_SIZE +
-                        (SCREEN_WIDTH - GRID_WIDTH * BLOCK_SIZE) // 2,
-                        (piece.y + y) * BLOCK_SIZE,
-                        BLOCK_SIZE - 1,
-                        BLOCK_SIZE - 1
-                    )
-                    pygame.draw.rect(self.screen, COLORS[piece.color], rect)
+        bs = BLOCK_SIZE
+        ox = GRID_OFFSET_X + piece.x * bs
+        oy = piece.y * bs
+        screen = self.screen
+        color = COLORS[piece.color]
+        draw_rect = pygame.draw.rect
+        for y, x in piece.offsets:
+            draw_rect(screen, color, (ox + x * bs, oy + y * bs, bs - 1, bs - 1))
+
+    def draw_hud(self):
+        """
+        Отрисовывает текст интерфейса (счет и уровень) поверх игрового поля.
+
+        Действия метода:
+            - Растеризует текст счета и уровня заново только при изменении значения,
+              иначе использует готовые поверхности из кэша (_score_cache, _level_cache).
+            - Выводит текст и запоминает занятые им области (self.hud_rects)
+              и клетки сетки под ними (self.hud_cells).
+        """
+
+        if self.score != self._score_cache[0]:
+            self._score_cache = (self.score, self.font.render(
+                f"Score: {self.score}", True, (255, 255, 255)).convert_alpha())
+        if self.level != self._level_cache[0]:
+            self._level_cache = (self.level, self.font.render(
+                f"Level: {self.level}", True, (255, 255, 255)).convert_alpha())
+        self.hud_rects = [
+            self.screen.blit(self._score_cache[1], (10, 10)),
+            self.screen.blit(self._level_cache[1], (10, 40))
+        ]
+        self.hud_cells = set()
+        for rect in self.hud_rects:
+            self.hud_cells.update(self.cells_in_rect(rect))
+
+    def draw_frame(self):
+        """
+        Отрисовывает кадр и передает изменения в окно.
+
+        Действия метода:
+            1. Полная перерисовка (первый кадр и перезапуск игры, признак full_redraw):
+               - Очищает экран, рисует сетку, фигуру и интерфейс, обновляет все окно.
+
+            2. Частичная перерисовка (остальные кадры):
+               - Изменившиеся клетки - self.dirty_cells и прошлое положение фигуры.
+               - Если изменился текст интерфейса, либо изменившиеся клетки или фигура
+                 задевают его, стирает старый текст и добавляет клетки под ним.
+               - Заливает изменившиеся клетки цветом из self.grid и восстанавливает
+                 поверх них линии сетки из self.grid_overlay.
+               - Рисует фигуру и при необходимости текст интерфейса.
+               - Передает в pygame.display.update() только перерисованные области.
+        """
+
+        screen = self.screen
+        piece_cells = self.piece_cells(self.current_piece)
+        if self.full_redraw:
+            screen.fill(COLORS[0])
+            self.draw_grid()
+            self.draw_piece(self.current_piece)
+            self.draw_hud()
+            pygame.display.update()
+            self.full_redraw = False
+        else:
+            dirty = self.dirty_cells
+            dirty.update(self.prev_piece_cells)
+            hud_changed = (self.score != self._score_cache[0] or self.level != self._level_cache[0])
+            redraw_hud = (hud_changed or not self.hud_cells.isdisjoint(dirty)
+                          or not self.hud_cells.isdisjoint(piece_cells))
+            update_rects = []
+            if redraw_hud:
+                for rect in self.hud_rects:
+                    screen.fill(COLORS[0], rect)
+                    screen.blit(self.grid_overlay, rect, rect)
+                dirty.update(self.hud_cells)
+                update_rects.extend(self.hud_rects)
+
+            grid = self.grid
+            cell_rects = self.cell_rects
+            overlay = self.grid_overlay
+            for y, x in dirty:
+                rect = cell_rects[y][x]
+                screen.fill(COLORS[grid[y, x]], rect)
+                screen.blit(overlay, rect, rect)
+                update_rects.append(rect)
+
+            self.draw_piece(self.current_piece)
+            update_rects.extend(cell_rects[y][x] for y, x in piece_cells)
+            if redraw_hud:
+                self.draw_hud()
+                update_rects.extend(self.hud_rects)
+            pygame.display.update(update_rects)
+
+        self.prev_piece_cells = piece_cells
+        self.dirty_cells = set()
+
+    def piece_cells(self, piece):
+        """
+        Возвращает список клеток (y, x) сетки, занимаемых блоками фигуры.
+        """
+
+        return [(piece.y + y, piece.x + x) for y, x in piece.offsets]
+
+    def cells_in_rect(self, rect):
+        """
+        Возвращает клетки (y, x) сетки, экранные блоки которых пересекаются с областью rect.
+        """
+
+        x0 = max(0, (rect.left - GRID_OFFSET_X) // BLOCK_SIZE)
+        x1 = min(GRID_WIDTH - 1, (rect.right - 1 - GRID_OFFSET_X) // BLOCK_SIZE)
+        y0 = max(0, rect.top // BLOCK_SIZE)
+        y1 = min(GRID_HEIGHT - 1, (rect.bottom - 1) // BLOCK_SIZE)
+        return [(y, x) for y in range(y0, y1 + 1) for x in range(x0, x1 + 1)]
 
     def check_collision(self, dx, dy):
         """
         Проверяет столкновение текущей фигуры с границами игрового поля или зафиксированными блоками.
 
         Действия метода:
-            1. Для каждой заполненной ячейки фигуры (cell == 1):
-                - Вычисляет новые координаты: new_x = текущий x + dx + смещение ячейки в форме.
-                - Вычисляет новые координаты: new_y = текущий y + dy + смещение ячейки в форме.
-            2. Проверяет условия столкновения:
-                - Выход за границы сетки: new_x < 0, new_x >= GRID_WIDTH, new_y >= GRID_HEIGHT.
-                - Пересечение с занятой ячейкой в сетке (new_y >= 0 и self.grid[new_y][new_x] != 0).
-            3. Возвращает True при первом обнаруженном столкновении.
-        """
-
-        for y, row in enumerate(self.current_piece.shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    new_x = self.current_piece.x + x + dx
-                    new_y = self.current_piece.y + y + dy
-                    if not (0 <= new_x < GRID_WIDTH and new_y < GRID_HEIGHT):
-                        return True
-                    if new_y >= 0 and self.grid[new_y][new_x]:
-                        return True
-        return False
+            1. Сдвигает битовую маску фигуры (piece.bits) на ее новую позицию в битовом поле:
+                - на x + dx + GRID_PADDING бит внутри строки;
+                - на (y + dy) * ROW_BITS бит по строкам (строки выше поля отбрасываются
+                  сдвигом вправо, они не могут столкнуться).
+            2. Возвращает True, если маска пересекается с битовым полем занятости (self.occ):
+                - Выход за границы сетки попадает на биты-стражи, поэтому
+                  отдельные проверки границ не нужны.
+
+        Если собрано C-расширение _tetris_core, проверка выполняется им (self.core) по self.grid.
+        """
+
+        piece = self.current_piece
+        if self.core is not None:
+            return self.core.check_collision(piece.x + dx, piece.y + dy, piece.bits)
+
+        row = piece.y + dy
+        mask = piece.bits << (piece.x + dx + GRID_PADDING)
+        if row >= 0:
+            mask <<= row * ROW_BITS
+        else:
+            mask >>= -row * ROW_BITS
+        return bool(self.occ & mask)
+
+    def drop_distance(self):
+        """
+        Вычисляет, на сколько строк текущая фигура может опуститься до столкновения.
+
+        Действия метода:
+            1. Для каждого столбца фигуры берет ее нижнюю ячейку (piece.column_bottoms).
+            2. Сдвигает битовое поле так, чтобы строка под этой ячейкой оказалась в младшем
+               бите, и оставляет только биты этого столбца (COLUMN_BITS).
+            3. Номер младшего установленного бита дает число свободных клеток под ячейкой;
+               биты-стражи под полем гарантируют, что такой бит всегда найдется.
+            4. Возвращает минимум по всем столбцам фигуры.
+        """
+
+        piece = self.current_piece
+        occ = self.occ
+        distance = GRID_HEIGHT
+        for x, y in piece.column_bottoms:
+            column = occ >> ((piece.y + y + 1) * ROW_BITS + piece.x + x + GRID_PADDING) & COLUMN_BITS
+            distance = min(distance, ((column & -column).bit_length() - 1) // ROW_BITS)
+        return distance
+
+    def move_left(self):
+        """
+        Сдвигает текущую фигуру на одну клетку влево, если там нет столкновения.
+        """
+
+        if not self.check_collision(-1, 0):
+            self.current_piece.x -= 1
+            self.dirty = True
+
+    def move_right(self):
+        """
+        Сдвигает текущую фигуру на одну клетку вправо, если там нет столкновения.
+        """
+
+        if not self.check_collision(1, 0):
+            self.current_piece.x += 1
+            self.dirty = True
+
+    def soft_drop(self):
+        """
+        Опускает текущую фигуру на одну клетку вниз, если там нет столкновения.
+        """
+
+        if not self.check_collision(0, 1):
+            self.current_piece.y += 1
+            self.dirty = True
+
+    def rotate_piece(self):
+        """
+        Поворачивает текущую фигуру; при столкновении после поворота возвращает прежний поворот.
+        """
+
+        self.current_piece.rotate()
+        if self.check_collision(0, 0):
+            for _ in range(3):
+                self.current_piece.rotate()
+        else:
+            self.dirty = True
+
+    def hard_drop(self):
+        """
+        Мгновенно опускает текущую фигуру до нижней позиции (drop_distance()) и фиксирует ее.
+        """
+
+        self.current_piece.y += self.drop_distance()
+        self.merge_piece()
 
     def merge_piece(self):
         """
@@ -208,10 +551,14 @@ class Game:
 
         Действия метода:
             1. Перенос блоков в сетку:
-               - Перебирает матрицу формы текущей фигуры (current_piece.shape).
-               - Для каждой заполненной ячейки (cell == 1) обновляет соответствующую позицию
-                 в игровой сетке (self.grid), присваивая ей цвет фигуры.
+               - Перебирает только заполненные ячейки фигуры (current_piece.offsets).
+               - Для каждой ячейки присваивает соответствующей позиции в игровой сетке
+                 (self.grid) цвет фигуры (в C-расширении _tetris_core, если оно собрано).
+               - Устанавливает биты фигуры в битовом поле занятости (self.occ).
+               - Увеличивает счетчики занятых клеток (self.row_counts) в строках фигуры.
                - Координаты вычисляются относительно позиции фигуры (current_piece.x, current_piece.y).
+               - Помечает занятые фигурой клетки как изменившиеся (self.dirty_cells)
+                 и выставляет признак изменения состояния (self.dirty).
 
             2. Очистка линий:
                - Вызывает метод clear_lines() для удаления заполненных горизонтальных линий,
@@ -220,10 +567,18 @@ class Game:
             3. Создание новой фигуры:
                - Вызывает new_piece() для генерации следующей фигуры.
         """
-        for y, row in enumerate(self.current_piece.shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    self.grid[self.current_piece.y + y][self.current_piece.x + x] = self.current_piece.color
+        piece = self.current_piece
+        if self.core is not None:
+            self.core.merge_piece(piece.x, piece.y, piece.bits, piece.color)
+        else:
+            for y, x in piece.offsets:
+                self.grid[piece.y + y, piece.x + x] = piece.color
+        self.occ |= piece.bits << (piece.y * ROW_BITS + piece.x + GRID_PADDING)
+        row_counts = self.row_counts
+        for y, _ in piece.offsets:
+            row_counts[piece.y + y] += 1
+        self.dirty_cells.update(self.piece_cells(piece))
+        self.dirty = True
         self.clear_lines()
         self.new_piece()
 
@@ -233,30 +588,49 @@ class Game:
 
         Действия метода:
             1. Поиск заполненных линий:
-               - Перебирает каждую строку сетки сверху вниз.
-               - Проверяет, все ли ячейки строки заняты (значение != 0).
+               - Ищет строки, счетчик занятых клеток которых (self.row_counts) равен GRID_WIDTH.
+               - Если ни одна строка не заполнена (основной случай), сразу завершает работу.
 
             2. Очистка линий:
-               - Удаляет найденные заполненные строки из сетки.
-               - Добавляет новые пустые строки ([0] * GRID_WIDTH) в верхнюю часть сетки.
+               - За один проход строит маску оставляемых строк и новый список счетчиков
+                 (пустые счетчики сверху, затем счетчики оставшихся строк), без удаления
+                 и вставки элементов списка.
+               - Копирует оставшиеся строки сетки в ее нижнюю часть одним присваиванием
+                 среза (массив изменяется на месте, его буфер использует self.core).
+               - Обнуляет освободившиеся строки в верхней части сетки.
+               - Вырезает заполненные строки из битового поля, сдвигая строки над ними.
                - Учитывает количество удаленных строк (lines_cleared).
 
             3. Обновление состояния игры:
                - Увеличивает счет: +100 очков за каждую удаленную строку * текущий уровень.
                - Пересчитывает уровень: level = 1 + score // 1000 (повышение каждые 1000 очков).
                - Уменьшает интервал падения фигур: fall_speed = max(100, 1000 - level * 100).
+               - Помечает как изменившиеся (self.dirty_cells) все клетки строк от верха поля
+                 до последней удаленной строки, так как эти строки сдвигаются.
         """
 
-        lines_cleared = 0
-        for i, row in enumerate(self.grid):
-            if all(row):
-                del self.grid[i]
-                self.grid.insert(0, [0] * GRID_WIDTH)
-                lines_cleared += 1
-        if lines_cleared:
-            self.score += 100 * lines_cleared * self.level
-            self.level = 1 + self.score // 1000
-            self.fall_speed = max(100, 1000 - (self.level * 100))
+        if GRID_WIDTH not in self.row_counts:
+            return
+
+        keep = [count != GRID_WIDTH for count in self.row_counts]
+        kept_counts = [count for count in self.row_counts if count != GRID_WIDTH]
+        lines_cleared = GRID_HEIGHT - len(kept_counts)
+        self.row_counts = [0] * lines_cleared + kept_counts
+        self.grid[lines_cleared:] = self.grid[keep]
+        self.grid[:lines_cleared] = 0
+
+        last = 0
+        for y, kept in enumerate(keep):
+            if not kept:
+                above = self.occ & ((1 << (y * ROW_BITS)) - 1)
+                below = self.occ >> ((y + 1) * ROW_BITS) << ((y + 1) * ROW_BITS)
+                self.occ = below | above << ROW_BITS | EMPTY_ROW
+                last = y
+        self.dirty_cells.update((y, x) for y in range(last + 1) for x in range(GRID_WIDTH))
+
+        self.score += 100 * lines_cleared * self.level
+        self.level = 1 + self.score // 1000
+        self.fall_speed = max(100, 1000 - (self.level * 100))
 
     def game_over(self):
         """
@@ -295,21 +669,26 @@ class Game:
                - Прерывается только при закрытии окна (событие pygame.QUIT).
 
             2. Обработка событий:
+               - Очередь содержит только события QUIT и KEYDOWN (остальные заблокированы в __init__).
+               - Обработчик клавиши выбирается по словарю self._key_handlers:
                - Клавиши ←/→: Движение фигуры влево/вправо с проверкой коллизий.
                - Клавиша ↓: Ускоренное падение фигуры вниз.
                - Клавиша ↑: Поворот фигуры (с коррекцией при выходе за границы).
-               - Пробел: Мгновенное падение фигуры до нижней позиции.
+               - Пробел: Мгновенное падение фигуры до нижней позиции (drop_distance()).
 
             3. Автоматическое падение:
                - Фигура смещается вниз каждые fall_speed миллисекунд (зависит от уровня).
                - При столкновении фиксируется в сетке (вызов merge_piece()).
 
-            4. Отрисовка:
-               - Очистка экрана, отрисовка сетки, активной фигуры и интерфейса (счет, уровень).
-               - Обновление текстовых элементов (score_text, level_text) в реальном времени.
+            4. Отрисовка и обновление окна (draw_frame()):
+               - Выполняется только если состояние игры изменилось (признак dirty выставляют
+                 обработчики клавиш, автоматическое падение, merge_piece() и перезапуск игры);
+                 в остальных кадрах цикл только обрабатывает события и ждет следующего кадра.
+               - Перерисовываются только изменившиеся клетки, фигура и при необходимости
+                 интерфейс (счет, уровень); в окно передаются только эти области.
+               - Весь экран перерисовывается только на первом кадре и после перезапуска игры.
         """
         while True:
-            self.screen.fill(COLORS[0])
             now = pygame.time.get_ticks()
 
             for event in pygame.event.get():
@@ -317,45 +696,22 @@ class Game:
                     pygame.quit()
                     return
                 elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_LEFT:
-                        if not self.check_collision(-1, 0):
-                            self.current_piece.x -= 1
-                    elif event.key == pygame.K_RIGHT:
-                        if not self.check_collision(1, 0):
-                            self.current_piece.x += 1
-                    elif event.key == pygame.K_DOWN:
-                        if not self.check_collision(0, 1):
-                            self.current_piece.y += 1
-                    elif event.key == pygame.K_UP:
-                        self.current_piece.rotate()
-                        if self.check_collision(0, 0):
-                            for _ in range(3):
-                                self.current_piece.rotate()
-                    elif event.key == pygame.K_SPACE:
-                        while not self.check_collision(0, 1):
-                            self.current_piece.y += 1
-                        self.merge_piece()
+                    handler = self._key_handlers.get(event.key)
+                    if handler:
+                        handler()
 
             if now - self.last_fall > self.fall_speed:
                 if not self.check_collision(0, 1):
                     self.current_piece.y += 1
                     self.last_fall = now
+                    self.dirty = True
                 else:
                     self.merge_piece()
 
-            self.draw_grid()
-            self.draw_piece(self.current_piece)
-
-            score_text = self.font.render(
-                f"Score: {self.score}", True, (255, 255, 255))
-            level_text = self.font.render(
-                f"Level: {self.level}", True, (255, 255, 255))
-            self.screen.blit(score_text, (10, 10))
-            self.screen.blit(level_text, (10, 40))
-
-            pygame.display.update()
+            if self.dirty:
+                self.draw_frame()
+                self.dirty = False
             self.clock.tick(FPS)
-            pygame.display.set_caption("Tetris")
 
 # Запуск игры
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Необязательное C-расширение с горячими операциями над игровым полем.
+
+Сборка: cythonize -i _tetris_core.pyx
+Если модуль не собран, Tetris.py использует реализацию на чистом Python.
+
+Форма фигуры передается битовой маской в формате битового поля Tetris.py:
+ячейка (x, y) формы хранится в бите y * row_bits + x. Фигура помещается в квадрат 4x4.
+"""
+
+
+cdef class Field:
+    """
+    Обертка над матрицей цветов игрового поля (np.ndarray uint8, C-порядок).
+
+    Буфер матрицы захватывается один раз при создании, поэтому вызовы методов
+    не тратят время на получение memoryview. Матрица должна изменяться только
+    на месте, без замены массива.
+
+    Attributes:
+        grid (unsigned char[:, ::1]): Представление матрицы цветов поля.
+        row_bits (int): Шаг строки в битовой маске фигуры.
+    """
+
+    cdef unsigned char[:, ::1] grid
+    cdef int row_bits
+
+    def __init__(self, unsigned char[:, ::1] grid, int row_bits):
+        self.grid = grid
+        self.row_bits = row_bits
+
+    cpdef bint check_collision(self, int x, int y, unsigned long long bits):
+        """
+        Проверяет, сталкивается ли фигура в позиции (x, y) с границами поля или занятыми клетками.
+
+        Ячейки фигуры выше поля (y < 0) не считаются столкновением.
+        """
+
+        cdef int height = self.grid.shape[0]
+        cdef int width = self.grid.shape[1]
+        cdef int i, j, gx, gy
+        for i in range(4):
+            gy = y + i
+            for j in range(4):
+                if not (bits >> (i * self.row_bits + j)) & 1:
+                    continue
+                gx = x + j
+                if gx < 0 or gx >= width or gy >= height:
+                    return True
+                if gy >= 0 and self.grid[gy, gx]:
+                    return True
+        return False
+
+    cpdef void merge_piece(self, int x, int y, unsigned long long bits, unsigned char color):
+        """
+        Записывает цвет фигуры в клетки поля, занятые фигурой в позиции (x, y).
+
+        Ячейки фигуры выше поля (y < 0) пропускаются.
+        """
+
+        cdef int i, j
+        for i in range(4):
+            if y + i < 0:
+                continue
+            for j in range(4):
+                if (bits >> (i * self.row_bits + j)) & 1:
+                    self.grid[y + i, x + j] = color